@@ -472,13 +472,34 @@ class SubjectFilter:
         return levelno >= self.level
 
 
+def _enable_windows_vt_processing():
+    # Windows 10 and later interpret ANSI escape sequences once virtual terminal processing is
+    # enabled on the console; older versions reject the mode and keep colors disabled.
+    try:
+        import ctypes
+        import ctypes.wintypes
+        # A private WinDLL instance keeps the prototypes below from leaking into `ctypes.windll`.
+        kernel32 = ctypes.WinDLL("kernel32")
+        kernel32.GetStdHandle.restype = ctypes.wintypes.HANDLE
+        kernel32.GetConsoleMode.argtypes = (ctypes.wintypes.HANDLE, ctypes.wintypes.LPDWORD)
+        kernel32.SetConsoleMode.argtypes = (ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD)
+        handle = kernel32.GetStdHandle(-12) # STD_ERROR_HANDLE
+        mode = ctypes.wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle,
+            mode.value | 0x0004)) # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
 def create_logger():
     root_logger = logging.getLogger()
 
     term_formatter_args = {"style": "{",
         "fmt": "{levelname[0]:s}: {name:s}: {message:s}"}
     term_handler = logging.StreamHandler()
-    if sys.stderr.isatty() and sys.platform != 'win32':
+    if sys.stderr.isatty() and (sys.platform != 'win32' or _enable_windows_vt_processing()):
         term_handler.setFormatter(TerminalFormatter(**term_formatter_args))
     else:
         term_handler.setFormatter(logging.Formatter(**term_formatter_args))